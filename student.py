@@ -1,10 +1,212 @@
 import mysql.connector
-from mysql.connector import Error
+from mysql.connector import Error, HAVE_CEXT, errorcode
+from mysql.connector.pooling import MySQLConnectionPool
 import sys
+import asyncio
 import getpass
+import os
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+try:
+    import aiomysql  # Optional: only needed for the async API (aconnect/add_many)
+except ImportError:
+    aiomysql = None
+
+# Horizontal rules for banners/menus and for student tables
+RULE = "=" * 60
+TABLE_RULE = "=" * 90
+
+# Main menu, rendered once
+MENU = "\n".join([
+    "\n" + RULE,
+    "📚 STUDENT MANAGEMENT SYSTEM",
+    RULE,
+    "1. ➕ Add New Student",
+    "2. ✏️  Update Student Information",
+    "3. ❌ Delete Student",
+    "4. 👥 View All Students",
+    "5. 🔍 Search Student by Name",
+    "6. 🔎 Search Student by ID",
+    "7. 📊 Display Student Count",
+    "8. 🚪 Exit",
+    "9. 🔁 Toggle Transactional Mode",
+    "10. 💾 Commit Batch",
+    RULE,
+])
+
+# Number of connections kept open in the pool
+POOL_SIZE = 8
+
+# Connect timeout for pooled connections, in seconds
+CONNECT_TIMEOUT = 5
+
+# Idle time after which the held connection is pinged before use, in seconds
+IDLE_PING_SECONDS = 60
+
+# mysql-connector already uses its C extension when it is built; set
+# SMS_USE_PURE=1 to opt out and use the pure-Python implementation instead
+USE_PURE = os.environ.get("SMS_USE_PURE") == "1" or not HAVE_CEXT
+
+# Fallback when the server's max_allowed_packet cannot be read (MySQL default)
+DEFAULT_MAX_ALLOWED_PACKET = 4 * 1024 * 1024
+
+# Usual locations of a local MySQL server's UNIX socket
+UNIX_SOCKET_PATHS = (
+    '/var/run/mysqld/mysqld.sock',
+    '/tmp/mysql.sock',
+    '/run/mysql/mysql.sock',
+)
+
+# Hard connect timeout for each automatic setup probe, in seconds
+PROBE_CONNECT_TIMEOUT = 2
+
+# Fraction of max_allowed_packet a single bulk INSERT may fill
+BULK_PACKET_FILL = 0.75
+
+# Maximum number of read results kept in the in-process cache
+RESULT_CACHE_SIZE = 128
+
+# Display format for created_at/updated_at, applied in Python to printed rows only
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Row layout of the student tables, compiled once: ID, name, age, class, marks, timestamp
+_ROW_FMT = "{:<5} {:<25} {:<5} {:<15} {:<10} {:<20}\n".format
+
+# Number of students shown per page by the View All menu option
+VIEW_PAGE_SIZE = 50
+
+# Rows fetched per round trip when streaming the full student listing
+STREAM_BATCH_SIZE = 1000
+
+# Fallback for innodb_ft_min_token_size when it cannot be read (InnoDB default)
+DEFAULT_FT_MIN_TOKEN_SIZE = 3
+
+# InnoDB's default FULLTEXT stopwords, which ft_name never stores; a search
+# for one of them has to go through the REGEXP fallback
+INNODB_FT_STOPWORDS = frozenset("""
+    a about an are as at be by com de en for from how i in is it la of on or
+    that the this to was what when where who will with und www
+""".split())
+
+# Secondary indexes on the students table, keyed by index name, as ALTER TABLE
+# clauses. Each one adds a little work to every write in exchange for
+# O(log N) lookups; the CLI is read-heavy, so that is the right tradeoff.
+STUDENT_INDEXES = {
+    # Word/prefix search on name via MATCH ... AGAINST
+    'ft_name': "ADD FULLTEXT INDEX ft_name (name)",
+    # Students in a given class, and per-class rankings by marks read in
+    # index order without a filesort
+    'idx_class_marks': "ADD INDEX idx_class_marks (class, marks DESC)",
+}
+
+# Columns update_student can set; bit i of an update mask selects column i
+UPDATE_COLUMNS = ("name", "age", "class", "marks")
+
+def _build_update_queries():
+    """
+    Precompute the UPDATE statement for every non-empty combination of columns.
+    
+    Returns:
+        Dictionary mapping a 4-bit column mask (1-15) to its UPDATE query
+    """
+    queries = {}
+    for mask in range(1, 1 << len(UPDATE_COLUMNS)):
+        assignments = ", ".join(f"{column} = %s" for bit, column in enumerate(UPDATE_COLUMNS)
+                                if mask & (1 << bit))
+        queries[mask] = f"""
+        UPDATE students 
+        SET {assignments}
+        WHERE id = %s
+        """
+    return queries
+
+# UPDATE statements keyed by column mask, built once at import
+_UPDATE_SQL = _build_update_queries()
+
+def _word_prefix_query(word_count):
+    """
+    Build the REGEXP query used when the FULLTEXT index can't serve a name search.
+    
+    Each word must start the name or follow a character that is not a letter,
+    digit or underscore, the same word boundaries the FULLTEXT parser uses,
+    so both paths give the same word-prefix matches.
+    
+    Args:
+        word_count: Number of search words
+        
+    Returns:
+        Query taking one _word_prefix_pattern() parameter per word
+    """
+    conditions = " AND ".join(["name REGEXP %s"] * word_count)
+    return f"""
+            SELECT id, name, age, class, marks, created_at, updated_at
+            FROM students 
+            WHERE {conditions}
+            ORDER BY name
+            """
+
+def _word_prefix_pattern(word):
+    """
+    Build the REGEXP pattern matching a word at the start of a word in a name.
+    
+    Args:
+        word: Search word of letters, digits and underscores, so it has no
+            regex metacharacters
+        
+    Returns:
+        Pattern for _word_prefix_query()
+    """
+    return f"(^|[^[:alnum:]_]){word}"
+
+def _format_timestamp(value):
+    """
+    Format a DATETIME/TIMESTAMP value returned by the driver for display.
+    
+    Args:
+        value: datetime object, or None
+        
+    Returns:
+        Formatted timestamp string (empty if value is None)
+    """
+    return value.strftime(TIMESTAMP_FORMAT) if value else ""
+
+def _find_unix_socket(host):
+    """
+    Find the UNIX socket of a local MySQL server.
+    
+    Args:
+        host: MySQL server hostname
+        
+    Returns:
+        Socket path, or None for remote hosts, on Windows, or if none exists
+    """
+    if os.name == 'nt' or host not in ('localhost', '127.0.0.1'):
+        return None
+    for path in UNIX_SOCKET_PATHS:
+        if os.path.exists(path):
+            return path
+    return None
+
+def _server_address(host, unix_socket=None):
+    """
+    Build the connect() arguments that locate the server.
+    
+    Args:
+        host: MySQL server hostname
+        unix_socket: UNIX socket path (optional); used instead of host when set
+        
+    Returns:
+        Dictionary with either 'unix_socket' or 'host'
+    """
+    return {'unix_socket': unix_socket} if unix_socket else {'host': host}
 
 class StudentManagementSystem:
-    def __init__(self, host, database, user, password):
+    def __init__(self, host, database, user, password, unix_socket=None):
         """
         Initialize the Student Management System with database connection parameters.
         
@@ -13,31 +215,124 @@ class StudentManagementSystem:
             database: Database name
             user: MySQL username
             password: MySQL password
+            unix_socket: Local server socket path (optional); skips TCP when set
         """
         self.host = host
         self.database = database
         self.user = user
         self.password = password
-        self.connection = None
+        self.unix_socket = unix_socket
+        
+        # Connection pool created in connect(); methods borrow from it via _conn()
+        self._pool = None
+        
+        # One pooled connection held for the thread that called connect(), so
+        # its calls skip the pool's per-borrow ping. _held_last_used is the
+        # time.monotonic() of its last use, or None to ping it before the next.
+        # Other threads share it while a batch is open, so every use of it and
+        # of _prepared holds _held_lock; the lock is reentrant so a call made
+        # while iterating iter_students() on the same thread doesn't deadlock
+        self._held_conn = None
+        self._held_thread = None
+        self._held_last_used = None
+        self._held_lock = threading.RLock()
+        
+        # aiomysql pool for the async API, created by aconnect()
+        self._apool = None
+        
+        # Whether start_batch() opened a transaction on the held connection;
+        # _conn() hands that connection to every call until the batch ends
+        self._batch_open = False
+        
+        # Server-side prepared cursors on the held connection, keyed by query,
+        # so each statement is prepared once and then only executed
+        self._prepared = {}
+        
+        # Server packet limit, read once per connection to size bulk inserts
+        self.max_allowed_packet = DEFAULT_MAX_ALLOWED_PACKET
+        
+        # Shortest word the FULLTEXT index holds; shorter terms fall back to REGEXP
+        self.ft_min_token_size = DEFAULT_FT_MIN_TOKEN_SIZE
+        self._fulltext_ready = False
+        
+        # LRU cache of read results, keyed by query kind and arguments.
+        # Entries are tagged with _version, which every write through this
+        # instance bumps; the student count is kept in memory the same way.
+        # _cache_lock guards all three, as pooled calls may run on any thread.
+        self._cache = OrderedDict()
+        self._version = 0
+        self._student_count = None
+        self._cache_lock = threading.Lock()
+        
+        # SQL for each fixed operation, keyed by operation name
+        self._stmts = {
+            'insert': """
+            INSERT INTO students (name, age, class, marks)
+            VALUES (%s, %s, %s, %s)
+            """,
+            'delete': "DELETE FROM students WHERE id = %s",
+            'count': "SELECT COUNT(*) FROM students",
+            'select_all': """
+            SELECT id, name, age, class, marks, created_at, updated_at
+            FROM students 
+            ORDER BY id
+            """,
+            'select_page': """
+            SELECT id, name, age, class, marks, created_at, updated_at
+            FROM students 
+            ORDER BY id
+            LIMIT %s OFFSET %s
+            """,
+            'search_id': """
+            SELECT id, name, age, class, marks, created_at, updated_at
+            FROM students 
+            WHERE id = %s
+            """,
+            'search_name': """
+            SELECT id, name, age, class, marks, created_at, updated_at
+            FROM students 
+            WHERE name LIKE %s
+            ORDER BY name
+            """,
+            'search_fulltext': """
+            SELECT id, name, age, class, marks, created_at, updated_at
+            FROM students 
+            WHERE MATCH(name) AGAINST (%s IN BOOLEAN MODE)
+            ORDER BY name
+            """,
+        }
         
     def connect(self):
         """
-        Establish a connection to the MySQL database.
+        Create the connection pool for the MySQL database.
         Handles connection errors gracefully.
         """
         try:
-            self.connection = mysql.connector.connect(
-                host=self.host,
+            # Session reset is skipped so returning a connection costs no round trip.
+            # Autocommit makes every single DDL/DML statement one round trip with
+            # no separate COMMIT; multi-statement work opens an explicit
+            # transaction instead.
+            self._pool = MySQLConnectionPool(
+                pool_name="sms",
+                pool_size=POOL_SIZE,
+                pool_reset_session=False,
                 database=self.database,
                 user=self.user,
                 password=self.password,
-                auth_plugin='mysql_native_password'  # Added for MySQL 8.0+
+                autocommit=True,
+                use_pure=USE_PURE,
+                connection_timeout=CONNECT_TIMEOUT,
+                auth_plugin='mysql_native_password',  # Added for MySQL 8.0+
+                **_server_address(self.host, self.unix_socket)
             )
             
-            if self.connection.is_connected():
-                print("✓ Successfully connected to MySQL database")
-                self.create_table_if_not_exists()
-                return True
+            self._held_conn = self._pool.get_connection()
+            self._held_thread = threading.get_ident()
+            self._held_last_used = time.monotonic()
+            print("✓ Successfully connected to MySQL database")
+            self._load_server_variables()
+            self.create_table_if_not_exists()
+            return True
                 
         except Error as e:
             print(f"✗ Error connecting to MySQL: {e}")
@@ -48,6 +343,120 @@ class StudentManagementSystem:
             print("4. Try using 'root' as username with empty password")
             return False
     
+    @contextmanager
+    def _conn(self):
+        """
+        Get a connection for one call. The thread that called connect(), and
+        every call while a batch is open, uses the held connection; other
+        threads borrow from the pool, which pings on each borrow.
+        
+        Calls on the held connection are serialized by _held_lock, so during a
+        batch other threads wait for the current call to finish rather than
+        sharing the connection with it.
+        
+        Yields:
+            A pooled MySQL connection
+        """
+        held = self._batch_open or threading.get_ident() == self._held_thread
+        if held:
+            self._held_lock.acquire()
+            connection = self._held_conn
+        else:
+            connection = self._pool.get_connection()
+        try:
+            if held:
+                self._ensure_live()
+            yield connection
+            if held:
+                self._held_last_used = time.monotonic()
+        except Error:
+            if held:
+                # A failed statement may leave its prepared cursor unusable or
+                # the connection lost; ping before the next use
+                self._forget_prepared()
+                self._held_last_used = None
+            raise
+        finally:
+            if held:
+                self._held_lock.release()
+            else:
+                # Closing a pooled connection hands it back to the pool
+                connection.close()
+    
+    def _ensure_live(self):
+        """
+        Ping the held connection if it was left idle for more than
+        IDLE_PING_SECONDS or its last statement failed, reconnecting if the
+        server dropped it (e.g. after wait_timeout).
+        """
+        conn = self._held_conn
+        if (self._held_last_used is not None
+                and time.monotonic() - self._held_last_used <= IDLE_PING_SECONDS):
+            return
+        connection_id = conn.connection_id
+        conn.ping(reconnect=True, attempts=3, delay=1)
+        if conn.connection_id != connection_id:
+            # Reconnected: statements prepared in the old session are gone
+            self._forget_prepared()
+            if self._batch_open:
+                # The open batch died with the old session
+                print("⚠ Connection was lost; uncommitted batch changes were discarded")
+                self._invalidate_cache()
+                self._student_count = None
+                conn.start_transaction()
+    
+    def _prepared_cursor(self, conn, query):
+        """
+        Get a cursor that runs a query on a connection from _conn().
+        
+        On the held connection the cursor is prepared and cached: the first
+        call sends COM_STMT_PREPARE and later calls only COM_STMT_EXECUTE.
+        A connection borrowed from the pool gets a plain buffered cursor, as
+        the pool may reconnect it between borrows.
+        
+        Args:
+            conn: Connection from _conn()
+            query: Parameterized SQL statement
+            
+        Returns:
+            A cursor returning tuple rows
+        """
+        if conn is not self._held_conn:
+            return conn.cursor(buffered=True)
+        cursor = self._prepared.get(query)
+        if cursor is None:
+            cursor = conn.cursor(prepared=True)
+            self._prepared[query] = cursor
+        return cursor
+    
+    def _forget_prepared(self):
+        """
+        Close the prepared cursors cached on the held connection.
+        """
+        for cursor in self._prepared.values():
+            try:
+                cursor.close()
+            except Error:
+                pass
+        self._prepared.clear()
+    
+    def _load_server_variables(self):
+        """
+        Cache the server variables that shape queries: max_allowed_packet
+        for chunking bulk inserts and innodb_ft_min_token_size for search.
+        Keeps the defaults if the variables cannot be read.
+        """
+        try:
+            with self._conn() as conn, conn.cursor(buffered=True) as cursor:
+                cursor.execute("SELECT @@max_allowed_packet, @@innodb_ft_min_token_size")
+                max_packet, ft_min_token_size = cursor.fetchone()
+            if max_packet:
+                self.max_allowed_packet = int(max_packet)
+            if ft_min_token_size:
+                self.ft_min_token_size = int(ft_min_token_size)
+        except Error as e:
+            print(f"⚠ Could not read server variables, using defaults: {e}")
+    
     def create_table_if_not_exists(self):
         """
         Create the students table if it doesn't exist.
@@ -66,15 +475,51 @@ class StudentManagementSystem:
         """
         
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(create_table_query)
-            self.connection.commit()
+            with self._conn() as conn, conn.cursor() as cursor:
+                cursor.execute(create_table_query)
             print("✓ Students table is ready")
         except Error as e:
             print(f"✗ Error creating table: {e}")
-        finally:
-            if cursor:
-                cursor.close()
+            return
+        
+        self.create_indexes_if_not_exist()
+    
+    def create_indexes_if_not_exist(self):
+        """
+        Add any missing secondary indexes from STUDENT_INDEXES in one
+        ALTER TABLE, so the table is usually rebuilt at most once. If that
+        fails, each index is tried on its own so one that can't be built
+        (e.g. FULLTEXT on a server without InnoDB FTS) doesn't block the rest.
+        Name search falls back to REGEXP if the FULLTEXT index is unavailable.
+        """
+        try:
+            with self._conn() as conn, conn.cursor(buffered=True) as cursor:
+                cursor.execute("SHOW INDEX FROM students")
+                # Key_name is the third column of SHOW INDEX
+                existing = {row[2] for row in cursor.fetchall()}
+                
+                missing = [name for name in STUDENT_INDEXES if name not in existing]
+                if len(missing) > 1:
+                    clauses = ", ".join(STUDENT_INDEXES[name] for name in missing)
+                    try:
+                        cursor.execute(f"ALTER TABLE students {clauses}")
+                        existing.update(missing)
+                        print("✓ Created indexes " + ", ".join(f"'{name}'" for name in missing))
+                        missing = []
+                    except Error:
+                        pass  # Retried one index at a time below
+                
+                for index_name in missing:
+                    try:
+                        cursor.execute(f"ALTER TABLE students {STUDENT_INDEXES[index_name]}")
+                        existing.add(index_name)
+                        print(f"✓ Created index '{index_name}'")
+                    except Error as e:
+                        print(f"⚠ Could not create index '{index_name}': {e}")
+            
+            self._fulltext_ready = 'ft_name' in existing
+        except Error as e:
+            print(f"✗ Error checking indexes: {e}")
     
     def add_student(self, name, age, class_name, marks):
         """
@@ -89,27 +534,145 @@ class StudentManagementSystem:
         Returns:
             The ID of the newly inserted student
         """
-        insert_query = """
-        INSERT INTO students (name, age, class, marks)
-        VALUES (%s, %s, %s, %s)
-        """
-        
         student_data = (name, age, class_name, marks)
-        cursor = None
         
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(insert_query, student_data)
-            self.connection.commit()
-            student_id = cursor.lastrowid
+            student_id, _ = self._insert_rows([student_data])
+            self._invalidate_cache(1)
             print(f"✓ Student added successfully with ID: {student_id}")
             return student_id
         except Error as e:
             print(f"✗ Error adding student: {e}")
             return None
-        finally:
-            if cursor:
-                cursor.close()
+    
+    def add_students_bulk(self, rows):
+        """
+        Add many students using multi-row INSERT statements.
+        
+        Rows are sent in as few statements as max_allowed_packet allows
+        and committed once at the end.
+        
+        Args:
+            rows: List of (name, age, class_name, marks) tuples
+            
+        Returns:
+            Tuple of (ID of the first inserted student, number of rows inserted)
+        """
+        if not rows:
+            print("ℹ No students provided for bulk insert")
+            return None, 0
+        
+        try:
+            first_id, row_count = self._insert_rows(rows)
+            self._invalidate_cache(row_count)
+            print(f"✓ {row_count} student(s) added successfully starting at ID: {first_id}")
+            return first_id, row_count
+        except Error as e:
+            print(f"✗ Error adding students: {e}")
+            return None, 0
+    
+    def _insert_rows(self, rows):
+        """
+        Insert rows in packet-sized chunks.
+        
+        A single chunk is one autocommitted statement; several chunks are
+        wrapped in one transaction, or in a savepoint when a batch transaction
+        is already open, so either all rows are inserted or none are.
+        Rolls back and re-raises on failure.
+        
+        Args:
+            rows: List of (name, age, class_name, marks) tuples
+            
+        Returns:
+            Tuple of (ID of the first inserted row, number of rows inserted)
+        """
+        first_id = None
+        row_count = 0
+        chunks = list(self._chunk_rows(rows))
+        
+        with self._conn() as conn:
+            in_transaction = len(chunks) > 1 and not conn.in_transaction
+            in_savepoint = len(chunks) > 1 and not in_transaction
+            try:
+                if in_transaction:
+                    conn.start_transaction()
+                if len(rows) == 1:
+                    # A single row goes through the cached prepared INSERT
+                    cursor = self._prepared_cursor(conn, self._stmts['insert'])
+                    cursor.execute(self._stmts['insert'], rows[0])
+                    return cursor.lastrowid, cursor.rowcount
+                # The text-protocol cursor rewrites executemany into one multi-row INSERT
+                with conn.cursor() as cursor:
+                    if in_savepoint:
+                        cursor.execute("SAVEPOINT sms_bulk_insert")
+                    for chunk in chunks:
+                        cursor.executemany(self._stmts['insert'], chunk)
+                        if first_id is None:
+                            first_id = cursor.lastrowid
+                        row_count += cursor.rowcount
+                    if in_savepoint:
+                        cursor.execute("RELEASE SAVEPOINT sms_bulk_insert")
+                if in_transaction:
+                    conn.commit()
+                return first_id, row_count
+            except Error:
+                if in_transaction:
+                    conn.rollback()
+                if in_savepoint:
+                    # Undo this call's chunks but keep the rest of the batch
+                    with conn.cursor() as cursor:
+                        cursor.execute("ROLLBACK TO SAVEPOINT sms_bulk_insert")
+                raise
+    
+    @staticmethod
+    def _row_size(row):
+        """
+        Estimate the wire size of a row of parameter values.
+        """
+        # Quoted values plus separators: a rough but safe upper bound
+        return sum(len(str(value)) * 2 + 4 for value in row) + 4
+    
+    def _chunk_rows(self, rows):
+        """
+        Split rows into lists whose estimated INSERT size stays under
+        BULK_PACKET_FILL of max_allowed_packet.
+        
+        Args:
+            rows: List of (name, age, class_name, marks) tuples
+            
+        Returns:
+            Iterator over lists of rows
+        """
+        return self._chunk_by_packet(rows, self._row_size, len(self._stmts['insert']))
+    
+    def _chunk_by_packet(self, items, item_size, base_size=0):
+        """
+        Split items into lists whose estimated size stays under
+        BULK_PACKET_FILL of max_allowed_packet.
+        
+        Args:
+            items: Iterable of items to group
+            item_size: Function returning the estimated size of one item
+            base_size: Fixed size added to every chunk
+            
+        Yields:
+            Lists of items
+        """
+        budget = int(self.max_allowed_packet * BULK_PACKET_FILL)
+        chunk = []
+        size = base_size
+        
+        for item in items:
+            current_size = item_size(item)
+            if chunk and size + current_size > budget:
+                yield chunk
+                chunk = []
+                size = base_size
+            chunk.append(item)
+            size += current_size
+        
+        if chunk:
+            yield chunk
     
     def update_student(self, student_id, name=None, age=None, class_name=None, marks=None):
         """
@@ -125,46 +688,27 @@ class StudentManagementSystem:
         Returns:
             Number of rows affected
         """
-        # Build dynamic update query based on provided parameters
-        update_fields = []
-        values = []
-        
-        if name:
-            update_fields.append("name = %s")
-            values.append(name)
-        if age is not None:
-            update_fields.append("age = %s")
-            values.append(age)
-        if class_name:
-            update_fields.append("class = %s")
-            values.append(class_name)
-        if marks is not None:
-            update_fields.append("marks = %s")
-            values.append(marks)
+        # Which columns to update, as a bitmask over UPDATE_COLUMNS
+        present = (bool(name), age is not None, bool(class_name), marks is not None)
+        mask = present[0] | (present[1] << 1) | (present[2] << 2) | (present[3] << 3)
         
         # If no fields to update, return early
-        if not update_fields:
+        if not mask:
             print("ℹ No fields provided for update")
             return 0
         
-        # Add student_id to values
+        values = [value for value, is_set in zip((name, age, class_name, marks), present) if is_set]
         values.append(student_id)
+        update_query = _UPDATE_SQL[mask]
         
-        # Create the update query
-        update_query = f"""
-        UPDATE students 
-        SET {', '.join(update_fields)}
-        WHERE id = %s
-        """
-        
-        cursor = None
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(update_query, values)
-            self.connection.commit()
-            rows_affected = cursor.rowcount
+            with self._conn() as conn:
+                cursor = self._prepared_cursor(conn, update_query)
+                cursor.execute(update_query, values)
+                rows_affected = cursor.rowcount
             
             if rows_affected > 0:
+                self._invalidate_cache()
                 print(f"✓ Student with ID {student_id} updated successfully")
             else:
                 print(f"⚠ No student found with ID {student_id}")
@@ -173,9 +717,6 @@ class StudentManagementSystem:
         except Error as e:
             print(f"✗ Error updating student: {e}")
             return 0
-        finally:
-            if cursor:
-                cursor.close()
     
     def delete_student(self, student_id):
         """
@@ -187,16 +728,14 @@ class StudentManagementSystem:
         Returns:
             Number of rows affected
         """
-        delete_query = "DELETE FROM students WHERE id = %s"
-        
-        cursor = None
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(delete_query, (student_id,))
-            self.connection.commit()
-            rows_affected = cursor.rowcount
+            with self._conn() as conn:
+                cursor = self._prepared_cursor(conn, self._stmts['delete'])
+                cursor.execute(self._stmts['delete'], (student_id,))
+                rows_affected = cursor.rowcount
             
             if rows_affected > 0:
+                self._invalidate_cache(-rows_affected)
                 print(f"✓ Student with ID {student_id} deleted successfully")
             else:
                 print(f"⚠ No student found with ID {student_id}")
@@ -205,106 +744,131 @@ class StudentManagementSystem:
         except Error as e:
             print(f"✗ Error deleting student: {e}")
             return 0
-        finally:
-            if cursor:
-                cursor.close()
     
-    def view_all_students(self):
+    def iter_students(self, batch_size=STREAM_BATCH_SIZE):
         """
-        Retrieve and display all students from the database.
+        Yield every student, ordered by ID, in lists of up to batch_size rows.
         
-        Returns:
-            List of all student records
+        Rows are streamed from an unbuffered cursor, so only one batch is held
+        in memory. Closing the generator early reads and discards the rest of
+        the result, which the connection needs before its next statement.
+        Until then it keeps the held connection, so other threads' calls on
+        it wait.
+        
+        Args:
+            batch_size: Rows fetched per round trip (optional)
+            
+        Yields:
+            Lists of (id, name, age, class, marks, created_at, updated_at) tuples
         """
-        select_query = """
-        SELECT id, name, age, class, marks, 
-               DATE_FORMAT(created_at, '%Y-%m-%d %H:%i:%s') as created_at,
-               DATE_FORMAT(updated_at, '%Y-%m-%d %H:%i:%s') as updated_at
-        FROM students 
-        ORDER BY id
+        with self._conn() as conn, conn.cursor(buffered=False) as cursor:
+            cursor.execute(self._stmts['select_all'])
+            try:
+                while True:
+                    batch = cursor.fetchmany(batch_size)
+                    if not batch:
+                        return
+                    yield batch
+            except GeneratorExit:
+                while cursor.fetchmany(batch_size):
+                    pass
+                raise
+    
+    def view_all_students(self, limit=None, offset=0):
         """
+        Retrieve and display students from the database, ordered by ID.
         
-        cursor = None
+        A page (limit given) is served through the result cache. The full
+        listing is streamed through iter_students(), so only one batch of
+        STREAM_BATCH_SIZE rows is held in memory. Use iter_students() to get
+        the rows themselves.
+        
+        Args:
+            limit: Maximum number of students to display (optional, default all)
+            offset: Number of students to skip before the first displayed one
+            
+        Returns:
+            Number of students displayed
+        """
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.execute(select_query)
-            students = cursor.fetchall()
+            if limit is None:
+                displayed = 0
+                for batch in self.iter_students():
+                    if not displayed:
+                        self._print_header('Created')
+                    self._print_rows(batch)
+                    displayed += len(batch)
+                
+                if displayed:
+                    print(TABLE_RULE)
+                    print(f"Total students: {displayed}")
+                else:
+                    print("ℹ No students found in the database")
+                return displayed
+            
+            students = self._fetch_cached(("page", limit, offset),
+                                          self._stmts['select_page'], (limit, offset))
             
             # Display results in a formatted table
             if students:
-                print("\n" + "="*90)
-                print(f"{'ID':<5} {'Name':<25} {'Age':<5} {'Class':<15} {'Marks':<10} {'Created':<20}")
-                print("="*90)
-                
-                for student in students:
-                    print(f"{student['id']:<5} {student['name']:<25} {student['age']:<5} "
-                          f"{student['class']:<15} {student['marks']:<10} {student['created_at']:<20}")
-                print("="*90)
-                print(f"Total students: {len(students)}")
+                self._print_header('Created')
+                self._print_rows(students)
+                print(TABLE_RULE)
+                print(f"Showing students {offset + 1}-{offset + len(students)} "
+                      f"of {self.get_student_count()}")
+            elif offset:
+                print("ℹ No more students to show")
             else:
                 print("ℹ No students found in the database")
                 
-            return students
+            return len(students)
         except Error as e:
             print(f"✗ Error retrieving students: {e}")
-            return []
-        finally:
-            if cursor:
-                cursor.close()
+            return 0
     
     def search_students(self, search_term=None, student_id=None):
         """
         Search for students by name or ID.
         
         Args:
-            search_term: Name or partial name to search for (optional)
+            search_term: Name, or the beginning of words in it, to search for
+                (optional); every word must start a word of the name
             student_id: Specific student ID to search for (optional)
             
         Returns:
-            List of matching student records
+            List of matching student records as
+            (id, name, age, class, marks, created_at, updated_at) tuples
         """
-        cursor = None
+        if student_id:
+            # Search by specific ID
+            key = ("search_id", student_id)
+            search_query, params = self._stmts['search_id'], (student_id,)
+        elif search_term:
+            # Search by name: word-prefix match through the FULLTEXT index, or
+            # the same match with REGEXP when the index can't serve the term
+            key = ("search_name", search_term)
+            words = re.findall(r"\w+", search_term)
+            if not words:
+                # No word characters to match on: plain substring search
+                search_query, params = self._stmts['search_name'], (f"%{search_term}%",)
+            elif self._fulltext_serves(search_term, words):
+                boolean_query = " ".join(f"+{word}*" for word in words)
+                search_query, params = self._stmts['search_fulltext'], (boolean_query,)
+            else:
+                search_query = _word_prefix_query(len(words))
+                params = [_word_prefix_pattern(word) for word in words]
+        else:
+            print("ℹ Please provide either a search term or student ID")
+            return []
         
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            
-            if student_id:
-                # Search by specific ID
-                search_query = """
-                SELECT id, name, age, class, marks, 
-                       DATE_FORMAT(created_at, '%Y-%m-%d %H:%i:%s') as created_at,
-                       DATE_FORMAT(updated_at, '%Y-%m-%d %H:%i:%s') as updated_at
-                FROM students 
-                WHERE id = %s
-                """
-                cursor.execute(search_query, (student_id,))
-            elif search_term:
-                # Search by name (partial match)
-                search_query = """
-                SELECT id, name, age, class, marks, 
-                       DATE_FORMAT(created_at, '%Y-%m-%d %H:%i:%s') as created_at,
-                       DATE_FORMAT(updated_at, '%Y-%m-%d %H:%i:%s') as updated_at
-                FROM students 
-                WHERE name LIKE %s
-                ORDER BY name
-                """
-                cursor.execute(search_query, (f"%{search_term}%",))
-            else:
-                print("ℹ Please provide either a search term or student ID")
-                return []
-            
-            students = cursor.fetchall()
+            students = self._fetch_cached(key, search_query, params)
             
             # Display results
             if students:
-                print("\n" + "="*90)
-                print(f"{'ID':<5} {'Name':<25} {'Age':<5} {'Class':<15} {'Marks':<10} {'Updated':<20}")
-                print("="*90)
-                
-                for student in students:
-                    print(f"{student['id']:<5} {student['name']:<25} {student['age']:<5} "
-                          f"{student['class']:<15} {student['marks']:<10} {student['updated_at']:<20}")
-                print("="*90)
+                self._print_header('Updated')
+                self._print_rows(students, show_updated=True)
+                print(TABLE_RULE)
                 print(f"Found {len(students)} matching student(s)")
             else:
                 if student_id:
@@ -316,56 +880,412 @@ class StudentManagementSystem:
         except Error as e:
             print(f"✗ Error searching students: {e}")
             return []
-        finally:
-            if cursor:
-                cursor.close()
+    
+    def _fulltext_serves(self, search_term, words):
+        """
+        Check whether MATCH ... AGAINST on ft_name finds every name the
+        REGEXP fallback would for a search term.
+        
+        It doesn't while a batch is open, as InnoDB only updates FULLTEXT
+        indexes at COMMIT; nor for words that are shorter than
+        innodb_ft_min_token_size or stopwords, which the index never holds;
+        nor for terms with punctuation, whose words the boolean-mode syntax
+        would read as operators.
+        
+        Args:
+            search_term: Name search term
+            words: Words of the search term
+            
+        Returns:
+            True if the FULLTEXT query can be used, False otherwise
+        """
+        return (self._fulltext_ready and not self.in_batch
+                and re.fullmatch(r"[\w\s]+", search_term) is not None
+                and all(len(word) >= self.ft_min_token_size
+                        and word.lower() not in INNODB_FT_STOPWORDS
+                        for word in words))
+    
+    @staticmethod
+    def _print_header(timestamp_label):
+        """
+        Print the header of a student table.
+        
+        Args:
+            timestamp_label: Heading for the timestamp column
+        """
+        print("\n" + TABLE_RULE)
+        sys.stdout.write(_ROW_FMT('ID', 'Name', 'Age', 'Class', 'Marks', timestamp_label))
+        print(TABLE_RULE)
+    
+    @staticmethod
+    def _print_rows(students, show_updated=False):
+        """
+        Print student records as rows of a student table.
+        All rows are formatted first and written with a single call.
+        
+        Args:
+            students: Iterable of (id, name, age, class, marks, created_at, updated_at) tuples
+            show_updated: Show updated_at instead of created_at
+        """
+        fmt = _ROW_FMT
+        fmt_ts = _format_timestamp
+        if show_updated:
+            lines = [fmt(id_, name, age, cls_, marks, fmt_ts(updated))
+                     for id_, name, age, cls_, marks, created, updated in students]
+        else:
+            lines = [fmt(id_, name, age, cls_, marks, fmt_ts(created))
+                     for id_, name, age, cls_, marks, created, updated in students]
+        sys.stdout.write("".join(lines))
     
     def get_student_count(self):
         """
         Get the total number of students in the database.
         
+        The count is read from the database once and then kept up to date
+        in memory by add, bulk add and delete.
+        
         Returns:
             Total student count
         """
-        count_query = "SELECT COUNT(*) as total FROM students"
+        with self._cache_lock:
+            version = self._version
+            if self._student_count is not None:
+                return self._student_count
         
-        cursor = None
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.execute(count_query)
-            result = cursor.fetchone()
-            return result['total'] if result else 0
+            with self._conn() as conn:
+                cursor = self._prepared_cursor(conn, self._stmts['count'])
+                cursor.execute(self._stmts['count'])
+                (total,) = cursor.fetchall()[0]
+            with self._cache_lock:
+                # A write on another thread during the query may not be counted
+                if version == self._version:
+                    self._student_count = total
+            return total
         except Error as e:
             print(f"✗ Error getting student count: {e}")
             return 0
-        finally:
-            if cursor:
-                cursor.close()
+    
+    def _fetch_cached(self, key, query, params=None):
+        """
+        Run a read query, serving repeated calls from the LRU cache.
+        
+        Only writes made through this instance invalidate the cache. Rows
+        are stored as a tuple and each caller gets its own list, so mutating
+        a returned list cannot corrupt the cache.
+        
+        Args:
+            key: Hashable cache key identifying the query and its arguments
+            query: SQL SELECT statement
+            params: Query parameters (optional)
+            
+        Returns:
+            List of result rows as tuples
+        """
+        with self._cache_lock:
+            version = self._version
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] == version:
+                self._cache.move_to_end(key)
+                return list(cached[1])
+        
+        # The query runs without the lock so other threads' reads don't wait
+        with self._conn() as conn:
+            cursor = self._prepared_cursor(conn, query)
+            cursor.execute(query, params)
+            rows = tuple(cursor.fetchall())
+        
+        with self._cache_lock:
+            # Rows read while another thread wrote may be stale: don't keep them
+            if version == self._version:
+                self._cache[key] = (version, rows)
+                self._cache.move_to_end(key)
+                if len(self._cache) > RESULT_CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        return list(rows)
+    
+    def _invalidate_cache(self, count_delta=0):
+        """
+        Drop cached read results after a write.
+        
+        Args:
+            count_delta: Change in the number of students caused by the write
+        """
+        with self._cache_lock:
+            self._version += 1
+            self._cache.clear()
+            if self._student_count is not None:
+                self._student_count += count_delta
+    
+    async def aconnect(self):
+        """
+        Create an aiomysql connection pool for the async API.
+        
+        The synchronous methods keep using the mysql.connector pool from
+        connect(); this pool serves concurrent callers such as add_many().
+        
+        Returns:
+            True if the pool was created, False otherwise
+        """
+        if aiomysql is None:
+            print("✗ aiomysql is not installed")
+            print("Install it using: pip install aiomysql")
+            return False
+        
+        try:
+            self._apool = await aiomysql.create_pool(
+                minsize=1,
+                maxsize=POOL_SIZE,
+                db=self.database,
+                user=self.user,
+                password=self.password,
+                autocommit=True,
+                **_server_address(self.host, self.unix_socket)
+            )
+            return True
+        except aiomysql.Error as e:
+            print(f"✗ Error creating async connection pool: {e}")
+            return False
+    
+    async def add_many(self, rows):
+        """
+        Insert students concurrently, one INSERT per row, over the async pool.
+        
+        Waits on the rows overlap across up to POOL_SIZE connections. For a
+        single caller, add_students_bulk() needs fewer round trips.
+        Requires aconnect(), and is refused in transactional mode because
+        its autocommitted inserts would bypass the open batch.
+        
+        Args:
+            rows: List of (name, age, class_name, marks) tuples
+            
+        Returns:
+            List of the IDs of the inserted students
+        """
+        if self._apool is None:
+            print("✗ Async connection pool is not open; call aconnect() first")
+            return []
+        if self.in_batch:
+            print("✗ Cannot add students concurrently in transactional mode; "
+                  "commit the batch first")
+            return []
+        
+        async def insert(row):
+            async with self._apool.acquire() as conn, conn.cursor() as cursor:
+                await cursor.execute(self._stmts['insert'], row)
+                return cursor.lastrowid
+        
+        results = await asyncio.gather(*(insert(row) for row in rows), return_exceptions=True)
+        student_ids = [result for result in results if not isinstance(result, BaseException)]
+        failures = [result for result in results if isinstance(result, BaseException)]
+        
+        if student_ids:
+            self._invalidate_cache(len(student_ids))
+            print(f"✓ {len(student_ids)} student(s) added successfully")
+        if failures:
+            print(f"✗ Error adding {len(failures)} student(s): {failures[0]}")
+        return student_ids
+    
+    async def aclose(self):
+        """
+        Close the async connection pool.
+        """
+        if self._apool:
+            self._apool.close()
+            await self._apool.wait_closed()
+            self._apool = None
+    
+    @property
+    def in_batch(self):
+        """
+        Whether transactional mode is on.
+        """
+        return self._batch_open
+    
+    def start_batch(self):
+        """
+        Turn on transactional mode.
+        
+        A transaction is opened on the held connection, so the following
+        adds, updates and deletes share one COMMIT (and one fsync) instead
+        of committing individually.
+        
+        Returns:
+            True if transactional mode is on, False otherwise
+        """
+        if self._batch_open:
+            return True
+        
+        try:
+            with self._conn() as conn:
+                conn.start_transaction()
+            self._batch_open = True
+            print("✓ Transactional mode on: changes are saved when you commit the batch")
+            return True
+        except Error as e:
+            print(f"✗ Error starting transaction: {e}")
+            return False
+    
+    def commit_batch(self, keep_open=True):
+        """
+        Commit the changes made in transactional mode.
+        
+        Args:
+            keep_open: Start a new transaction and stay in transactional mode;
+                otherwise go back to autocommit
+                
+        Returns:
+            True if the batch was committed, False otherwise
+        """
+        if not self._batch_open:
+            print("ℹ Transactional mode is off; changes are already saved")
+            return False
+        
+        try:
+            with self._conn() as conn:
+                conn.commit()
+                print("✓ Batch committed")
+                if keep_open:
+                    conn.start_transaction()
+                else:
+                    self._batch_open = False
+                    print("✓ Transactional mode off")
+            return True
+        except Error as e:
+            print(f"✗ Error committing batch: {e}")
+            return False
+    
+    def rollback_batch(self):
+        """
+        Discard the changes made in transactional mode and turn it off.
+        """
+        if not self._batch_open:
+            return
+        
+        with self._held_lock:
+            try:
+                self._held_conn.rollback()
+                print("⚠ Uncommitted batch changes were rolled back")
+            except Error as e:
+                print(f"✗ Error rolling back batch: {e}")
+            finally:
+                # Cached results and the count may include the discarded changes
+                self._invalidate_cache()
+                self._student_count = None
+                self._batch_open = False
     
     def close_connection(self):
         """
-        Close the database connection.
+        Close every connection held by the pool.
+        Any batch still open is rolled back first.
         """
-        if self.connection and self.connection.is_connected():
-            self.connection.close()
+        self.rollback_batch()
+        with self._held_lock:
+            self._forget_prepared()
+            if self._held_conn is not None:
+                try:
+                    self._held_conn.close()
+                except Error:
+                    pass
+                self._held_conn = None
+                self._held_thread = None
+        if self._pool:
+            self._pool._remove_connections()
+            self._pool = None
             print("✓ Database connection closed")
 
 def display_menu():
     """
     Display the main menu for the Student Management System.
     """
-    print("\n" + "="*60)
-    print("📚 STUDENT MANAGEMENT SYSTEM")
-    print("="*60)
-    print("1. ➕ Add New Student")
-    print("2. ✏️  Update Student Information")
-    print("3. ❌ Delete Student")
-    print("4. 👥 View All Students")
-    print("5. 🔍 Search Student by Name")
-    print("6. 🔎 Search Student by ID")
-    print("7. 📊 Display Student Count")
-    print("8. 🚪 Exit")
-    print("="*60)
+    print(MENU)
+
+# Lines of piped/redirected stdin, read in one go on first use
+_scripted_lines = None
+
+def read_input(prompt=""):
+    """
+    Read one line of user input.
+    
+    On a terminal this is input(prompt). When stdin is piped or redirected
+    the whole input is read once and lines are handed out from a deque
+    without printing the prompt.
+    
+    Args:
+        prompt: Prompt shown on a terminal
+        
+    Returns:
+        The input line without its line ending
+        
+    Raises:
+        EOFError: When scripted input is exhausted
+    """
+    global _scripted_lines
+    if sys.stdin.isatty():
+        return input(prompt)
+    if _scripted_lines is None:
+        _scripted_lines = deque(sys.stdin.read().splitlines())
+    if not _scripted_lines:
+        raise EOFError
+    return _scripted_lines.popleft()
+
+def read_password(prompt):
+    """
+    Read a password without echo on a terminal, or from scripted input.
+    
+    Args:
+        prompt: Prompt shown on a terminal
+        
+    Returns:
+        The entered password
+    """
+    if sys.stdin.isatty():
+        return getpass.getpass(prompt)
+    return read_input(prompt)
+
+# Plain decimal number, as accepted for marks
+_DECIMAL_RE = re.compile(r"^-?(\d+(\.\d*)?|\.\d+)$", re.ASCII)
+
+def _parse_int_range(raw, lo, hi):
+    """
+    Parse an integer within [lo, hi] without raising on bad input.
+    
+    Args:
+        raw: Input text
+        lo: Smallest accepted value
+        hi: Largest accepted value
+        
+    Returns:
+        The integer, or None if the text is not an integer in range
+    """
+    s = raw.strip()
+    digits = s[1:] if s.startswith('-') else s
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    # More digits than the bounds have is out of range, and int() refuses
+    # strings past sys.get_int_max_str_digits()
+    if len(digits.lstrip('0')) > len(str(max(abs(lo), abs(hi)))):
+        return None
+    value = int(s)
+    return value if lo <= value <= hi else None
+
+def _parse_float_range(raw, lo, hi):
+    """
+    Parse a decimal number within [lo, hi] without raising on bad input.
+    
+    Args:
+        raw: Input text
+        lo: Smallest accepted value
+        hi: Largest accepted value
+        
+    Returns:
+        The number as a float, or None if the text is not a number in range
+    """
+    s = raw.strip()
+    if not _DECIMAL_RE.match(s):
+        return None
+    value = float(s)
+    return value if lo <= value <= hi else None
 
 def get_student_input():
     """
@@ -375,45 +1295,81 @@ def get_student_input():
         Tuple of (name, age, class_name, marks)
     """
     print("\n📝 Enter Student Details:")
-    name = input("Name: ").strip()
+    name = read_input("Name: ").strip()
     if not name:
         print("⚠ Name cannot be empty!")
         return None
     
     while True:
-        try:
-            age = int(input("Age: "))
-            if age < 5 or age > 25:
-                print("⚠ Please enter a valid age (5-25)")
-                continue
+        age = _parse_int_range(read_input("Age: "), 5, 25)
+        if age is not None:
             break
-        except ValueError:
-            print("⚠ Please enter a valid number for age")
+        print("⚠ Please enter a valid age (5-25)")
     
-    class_name = input("Class: ").strip()
+    class_name = read_input("Class: ").strip()
     if not class_name:
         print("⚠ Class cannot be empty!")
         return None
     
     while True:
-        try:
-            marks = float(input("Marks (0-100): "))
-            if marks < 0 or marks > 100:
-                print("⚠ Please enter marks between 0 and 100")
-                continue
+        marks = _parse_float_range(read_input("Marks (0-100): "), 0, 100)
+        if marks is not None:
             break
-        except ValueError:
-            print("⚠ Please enter a valid number for marks")
+        print("⚠ Please enter marks between 0 and 100")
     
     return name, age, class_name, marks
 
+def _try_connect(config):
+    """
+    Probe one connection configuration, creating its database if missing.
+    The probe connection is always closed before returning. Nothing is
+    printed, as probes run on worker threads.
+    
+    Args:
+        config: Dictionary of StudentManagementSystem arguments
+        
+    Returns:
+        Tuple of (config, whether the database was created) if the server
+        accepted it, otherwise None
+    """
+    connect_args = {
+        **_server_address(config['host'], config.get('unix_socket')),
+        'user': config['user'],
+        'password': config['password'],
+        'connection_timeout': PROBE_CONNECT_TIMEOUT,
+        'use_pure': USE_PURE,
+    }
+    probe = None
+    
+    try:
+        probe = mysql.connector.connect(database=config['database'], **connect_args)
+        return config, False
+    except Error as e:
+        if e.errno != errorcode.ER_BAD_DB_ERROR:
+            return None
+    finally:
+        if probe:
+            probe.close()
+    
+    # Server reachable but the database is missing: create it
+    try:
+        probe = mysql.connector.connect(**connect_args)
+        with probe.cursor() as cursor:
+            cursor.execute(f"CREATE DATABASE IF NOT EXISTS {config['database']}")
+        return config, True
+    except Error:
+        return None
+    finally:
+        if probe:
+            probe.close()
+
 def setup_database():
     """
     Interactive database setup with multiple connection attempts.
     """
-    print("\n" + "="*60)
+    print("\n" + RULE)
     print("🔧 DATABASE SETUP")
-    print("="*60)
+    print(RULE)
     
     # Try common configurations
     configs = [
@@ -425,49 +1381,57 @@ def setup_database():
         {'host': '127.0.0.1', 'database': 'student_db', 'user': 'root', 'password': ''},
     ]
     
-    print("\nAttempting to connect with common configurations...")
+    # Local servers are also probed over their UNIX socket, which skips the TCP stack
+    socket_configs = []
+    for config in configs:
+        unix_socket = _find_unix_socket(config['host'])
+        socket_config = {**config, 'host': 'localhost', 'unix_socket': unix_socket}
+        if unix_socket and socket_config not in socket_configs:
+            socket_configs.append(socket_config)
+    configs = socket_configs + configs
     
+    print("\nAttempting to connect with common configurations...")
     for config in configs:
-        print(f"\nTrying: {config['user']}@{config['host']} (password: {'*' * len(config['password']) if config['password'] else 'none'})")
-        
-        sms = StudentManagementSystem(**config)
+        via = f" via {config['unix_socket']}" if config.get('unix_socket') else ""
+        print(f"Trying: {config['user']}@{config['host']}{via} (password: {'*' * len(config['password']) if config['password'] else 'none'})")
+    
+    # Probe all configurations at once, but keep the first working one in
+    # list order so the socket configurations win over TCP
+    result = None
+    executor = ThreadPoolExecutor(max_workers=len(configs))
+    futures = [executor.submit(_try_connect, config) for config in configs]
+    for future in futures:
+        result = future.result()
+        if result:
+            break
+    # Lower-priority probes close their own connections; don't wait for them
+    executor.shutdown(wait=False, cancel_futures=True)
+    
+    if result:
+        found, created = result
+        if created:
+            print(f"✓ Created database '{found['database']}'")
+        print(f"\n✓ Reached MySQL as {found['user']}@{found['host']}")
+        sms = StudentManagementSystem(**found)
         if sms.connect():
             return sms
-        
-        # Try to create database if it doesn't exist
-        try:
-            temp_conn = mysql.connector.connect(
-                host=config['host'],
-                user=config['user'],
-                password=config['password']
-            )
-            cursor = temp_conn.cursor()
-            cursor.execute("CREATE DATABASE IF NOT EXISTS student_db")
-            print("✓ Created database 'student_db'")
-            cursor.close()
-            temp_conn.close()
-            
-            # Try connecting again
-            if sms.connect():
-                return sms
-        except:
-            continue
     
     # Manual configuration
-    print("\n" + "="*60)
+    print("\n" + RULE)
     print("Please enter your MySQL credentials manually:")
-    print("="*60)
+    print(RULE)
     
-    host = input("Host (default: localhost): ").strip() or "localhost"
-    user = input("Username (default: root): ").strip() or "root"
-    password = getpass.getpass("Password (press Enter if none): ")
-    database = input("Database name (default: student_db): ").strip() or "student_db"
+    host = read_input("Host (default: localhost): ").strip() or "localhost"
+    user = read_input("Username (default: root): ").strip() or "root"
+    password = read_password("Password (press Enter if none): ")
+    database = read_input("Database name (default: student_db): ").strip() or "student_db"
     
     config = {
         'host': host,
         'database': database,
         'user': user,
-        'password': password
+        'password': password,
+        'unix_socket': _find_unix_socket(host)
     }
     
     sms = StudentManagementSystem(**config)
@@ -478,9 +1442,9 @@ def setup_database():
     print("\n⚠ Could not connect to database. Trying to create it...")
     try:
         temp_conn = mysql.connector.connect(
-            host=host,
             user=user,
-            password=password
+            password=password,
+            **_server_address(host, config['unix_socket'])
         )
         cursor = temp_conn.cursor()
         cursor.execute(f"CREATE DATABASE IF NOT EXISTS {database}")
@@ -499,9 +1463,9 @@ def main():
     """
     Main function to run the Student Management System.
     """
-    print("\n" + "="*60)
+    print("\n" + RULE)
     print("🎓 WELCOME TO STUDENT MANAGEMENT SYSTEM")
-    print("="*60)
+    print(RULE)
     
     # Setup database connection
     sms = setup_database()
@@ -522,7 +1486,7 @@ def main():
             display_menu()
             
             try:
-                choice = input("\n👉 Enter your choice (1-8): ").strip()
+                choice = read_input("\n👉 Enter your choice (1-10): ").strip()
                 
                 if choice == '1':
                     # Add new student
@@ -533,17 +1497,17 @@ def main():
                 elif choice == '2':
                     # Update student information
                     try:
-                        student_id = int(input("Enter student ID to update: "))
+                        student_id = int(read_input("Enter student ID to update: "))
                         
                         print("\nEnter new information (leave blank to keep current value):")
-                        name = input("Name: ").strip() or None
+                        name = read_input("Name: ").strip() or None
                         
-                        age_input = input("Age: ").strip()
+                        age_input = read_input("Age: ").strip()
                         age = int(age_input) if age_input else None
                         
-                        class_name = input("Class: ").strip() or None
+                        class_name = read_input("Class: ").strip() or None
                         
-                        marks_input = input("Marks: ").strip()
+                        marks_input = read_input("Marks: ").strip()
                         marks = float(marks_input) if marks_input else None
                         
                         if any([name, age is not None, class_name, marks is not None]):
@@ -557,8 +1521,8 @@ def main():
                 elif choice == '3':
                     # Delete student
                     try:
-                        student_id = int(input("Enter student ID to delete: "))
-                        confirm = input(f"⚠ Are you sure you want to delete student with ID {student_id}? (yes/no): ").lower()
+                        student_id = int(read_input("Enter student ID to delete: "))
+                        confirm = read_input(f"⚠ Are you sure you want to delete student with ID {student_id}? (yes/no): ").lower()
                         if confirm == 'yes':
                             sms.delete_student(student_id)
                         else:
@@ -567,12 +1531,24 @@ def main():
                         print("⚠ Please enter a valid student ID")
                         
                 elif choice == '4':
-                    # View all students
-                    sms.view_all_students()
+                    # View all students, one page at a time, or the rest at once
+                    offset = 0
+                    while True:
+                        displayed = sms.view_all_students(limit=VIEW_PAGE_SIZE, offset=offset)
+                        offset += displayed
+                        if displayed < VIEW_PAGE_SIZE or offset >= sms.get_student_count():
+                            break
+                        action = read_input("Press Enter for the next page, 'a' to show all, "
+                                            "or 'q' to stop: ").strip().lower()
+                        if action == 'a':
+                            sms.view_all_students()
+                            break
+                        if action == 'q':
+                            break
                     
                 elif choice == '5':
                     # Search by name
-                    search_term = input("Enter student name or part of name to search: ").strip()
+                    search_term = read_input("Enter a name, or the start of words in it, to search: ").strip()
                     if search_term:
                         sms.search_students(search_term=search_term)
                     else:
@@ -581,7 +1557,7 @@ def main():
                 elif choice == '6':
                     # Search by ID
                     try:
-                        student_id = int(input("Enter student ID to search: "))
+                        student_id = int(read_input("Enter student ID to search: "))
                         sms.search_students(student_id=student_id)
                     except ValueError:
                         print("⚠ Please enter a valid student ID")
@@ -592,16 +1568,34 @@ def main():
                     print(f"\n📊 Total students in database: {count}")
                     
                 elif choice == '8':
-                    # Exit
+                    # Exit, saving any pending batch
+                    if sms.in_batch:
+                        sms.commit_batch(keep_open=False)
                     print("\n👋 Thank you for using Student Management System. Goodbye!")
                     break
                     
+                elif choice == '9':
+                    # Toggle transactional mode; turning it off commits the batch
+                    if sms.in_batch:
+                        sms.commit_batch(keep_open=False)
+                    else:
+                        sms.start_batch()
+                    
+                elif choice == '10':
+                    # Commit the current batch and keep batching
+                    sms.commit_batch()
+                    
                 else:
-                    print("❌ Invalid choice. Please enter a number between 1 and 8.")
+                    print("❌ Invalid choice. Please enter a number between 1 and 10.")
                     
             except KeyboardInterrupt:
                 print("\n\n⚠ Program interrupted by user")
                 break
+            except EOFError:
+                # Scripted input ran out: treat it like Exit and save the batch
+                if sms.in_batch:
+                    sms.commit_batch(keep_open=False)
+                break
             except Exception as e:
                 print(f"❌ An error occurred: {e}")
                 